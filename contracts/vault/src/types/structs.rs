@@ -153,3 +153,15 @@ pub struct VaultViewState {
     /// Block epoch height when this view was produced.
     pub current_epoch: EpochHeight,
 }
+
+/// Combined view returned from the `get_vault_snapshot` method.
+#[derive(Serialize, Deserialize, Clone)]
+#[cfg_attr(not(target_arch = "wasm32"), derive(JsonSchema))]
+#[serde(crate = "near_sdk::serde")]
+pub struct VaultSnapshot {
+    /// Same payload as `get_vault_state`.
+    pub state: VaultViewState,
+    #[cfg_attr(not(target_arch = "wasm32"), schemars(with = "String"))]
+    /// Same value as `view_available_balance`.
+    pub available_balance: U128,
+}
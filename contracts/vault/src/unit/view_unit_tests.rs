@@ -128,6 +128,29 @@ mod tests {
         assert_eq!(available.0, expected);
     }
 
+    #[test]
+    fn test_get_vault_snapshot_matches_individual_views() {
+        let mut context = near_sdk::test_utils::VMContextBuilder::new();
+        context
+            .predecessor_account_id(owner())
+            .account_balance(NearToken::from_near(5))
+            .storage_usage(1_000);
+        testing_env!(context.build());
+
+        let mut vault = Vault::new(owner(), 3, 1);
+        vault.is_listed_for_takeover = true;
+
+        let snapshot = vault.get_vault_snapshot();
+        let state = vault.get_vault_state();
+        assert_eq!(snapshot.state.owner, state.owner);
+        assert_eq!(snapshot.state.index, 3);
+        assert!(snapshot.state.is_listed_for_takeover);
+        assert_eq!(
+            snapshot.available_balance.0,
+            vault.view_available_balance().0
+        );
+    }
+
     #[test]
     fn test_get_refund_entries_filters_by_account() {
         let context = get_context(owner(), NearToken::from_near(10), None);
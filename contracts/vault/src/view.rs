@@ -1,7 +1,7 @@
 #![allow(dead_code)]
 
 use crate::contract::{Vault, VaultExt};
-use crate::types::{CounterOffer, RefundEntry, UnstakeEntry, VaultViewState};
+use crate::types::{CounterOffer, RefundEntry, UnstakeEntry, VaultSnapshot, VaultViewState};
 use near_sdk::json_types::U128;
 use near_sdk::{env, near_bindgen, AccountId};
 
@@ -24,6 +24,15 @@ impl Vault {
         }
     }
 
+    /// Returns the vault state together with the available balance,
+    /// so clients can read both with a single view call.
+    pub fn get_vault_snapshot(&self) -> VaultSnapshot {
+        VaultSnapshot {
+            state: self.get_vault_state(),
+            available_balance: self.view_available_balance(),
+        }
+    }
+
     /// Returns a list of active validator account IDs this vault is currently staked with.
     pub fn get_active_validators(&self) -> Vec<String> {
         self.active_validators